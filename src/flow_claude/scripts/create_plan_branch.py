@@ -6,6 +6,8 @@ import json
 import subprocess
 import sys
 
+from flow_claude.utils.json_output import print_json
+
 
 async def create_plan_branch(
     session_name: str,
@@ -193,7 +195,7 @@ Output:
         technology_stack=args.tech_stack
     ))
 
-    print(json.dumps(result, indent=2))
+    print_json(result)
     return 0 if result.get('success') else 1
 
 
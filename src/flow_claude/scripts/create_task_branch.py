@@ -6,6 +6,8 @@ import json
 import subprocess
 import sys
 
+from flow_claude.utils.json_output import print_json
+
 
 async def create_task_branch(
     task_id: str,
@@ -163,7 +165,7 @@ Output:
         depends_on=depends_on
     ))
 
-    print(json.dumps(result, indent=2))
+    print_json(result)
     return 0 if result.get('success') else 1
 
 
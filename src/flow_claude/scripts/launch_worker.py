@@ -4,10 +4,17 @@ This module provides worker management using Claude SDK's query() function
 for parallel task execution.
 """
 
+import argparse
 import asyncio
 import json
 import os
+import re
+import shutil
+import stat
+import subprocess
 import sys
+import time
+from importlib.resources import files
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
@@ -20,8 +27,36 @@ if sys.platform == 'win32':
         sys.stderr.reconfigure(encoding='utf-8', errors='replace')
 
 from claude_agent_sdk import ClaudeAgentOptions, query
+from flow_claude.utils.json_output import print_json
 from flow_claude.utils.mcp_loader import load_project_mcp_config
 
+# MCP tool names follow mcp__<servername>__<toolname>
+_MCP_TOOL_RE = re.compile(r'mcp__(.*?)__')
+
+# Worker workflow instructions shipped with the package
+_WORKER_PROMPT_FILE = str(files('flow_claude').joinpath('templates/agents/worker-template.md'))
+
+# System prompt shared by every worker (never mutated)
+_WORKER_SYSTEM_PROMPT = {
+    "type": "preset",
+    "preset": "claude_code",
+    "append": "**Instructions:** See "+_WORKER_PROMPT_FILE+" for your full workflow."
+}
+
+# Settings files workers load
+_WORKER_SETTING_SOURCES = ["user", "project", "local"]
+
+# Core tools always available to workers
+# NOTE: AskUserQuestion is excluded - workers must work autonomously
+_CORE_WORKER_TOOLS = (
+    'Bash', 'Glob', 'Grep', 'Read', 'Edit', 'Write', 'NotebookEdit',
+    'WebFetch', 'TodoWrite', 'WebSearch', 'BashOutput', 'KillShell',
+    'Skill', 'SlashCommand'
+)
+
+# Core git MCP tools (always available)
+_CORE_GIT_MCP_TOOLS = ()
+
 
 def extract_mcp_server_names(allowed_tools: List[str]) -> set:
     """Extract MCP server names from tool names.
@@ -41,18 +76,7 @@ def extract_mcp_server_names(allowed_tools: List[str]) -> set:
         >>> extract_mcp_server_names(['mcp__custom__action', 'mcp__other__tool', 'Bash'])
         {'custom', 'other'}
     """
-    server_names = set()
-
-    for tool in allowed_tools:
-        # Check if it's an MCP tool (starts with 'mcp__')
-        if tool.startswith('mcp__'):
-            # Split by '__' and extract server name (second part)
-            parts = tool.split('__')
-            if len(parts) >= 3:  # mcp__servername__toolname
-                server_name = parts[1]
-                server_names.add(server_name)
-
-    return server_names
+    return {m.group(1) for tool in allowed_tools if (m := _MCP_TOOL_RE.match(tool))}
 
 
 def build_worker_mcp_servers(working_dir: Path, allowed_tools: Optional[List[str]] = None) -> Dict[str, Any]:
@@ -83,12 +107,16 @@ def build_worker_mcp_servers(working_dir: Path, allowed_tools: Optional[List[str
 
     }
 
+    # No extra tools requested means no project MCP servers are needed
+    if not allowed_tools:
+        return worker_mcp_servers
+
     # Load project MCP config from .mcp.json in worker's directory
     project_mcp_config = load_project_mcp_config(working_dir)
 
     # Extract MCP server names needed from allowed_tools
     # and add them from project config (external MCP servers)
-    if allowed_tools and project_mcp_config:
+    if project_mcp_config:
         needed_server_names = extract_mcp_server_names(allowed_tools)
         for server_name in needed_server_names:
             if server_name in project_mcp_config:
@@ -97,28 +125,13 @@ def build_worker_mcp_servers(working_dir: Path, allowed_tools: Optional[List[str
     return worker_mcp_servers
 
 
-def _validate_worker_params(worker_id: str, task_branch: str,
-                            session_info: Dict[str, Any],
-                            cwd: str) -> tuple[bool, Optional[str]]:
-    """Validate essential worker parameters before launching.
-
-    Performs minimal validation to catch critical errors early before expensive
-    SDK initialization (fail fast).
-
-    Args:
-        worker_id: Worker identifier
-        task_branch: Git branch for the task
-        session_info: Session metadata
-        cwd: Working directory path
+# Successful validations, keyed by (task_branch, cwd) -> monotonic timestamp
+_VALIDATION_TTL = 5.0
+_validation_cache: Dict[tuple[str, str], float] = {}
 
-    Returns:
-        Tuple of (success: bool, error_message: Optional[str])
-        - (True, None) if all validations pass
-        - (False, error_msg) if validation fails
-    """
-    import subprocess
 
-    # Validate task_branch exists in git (fail fast - avoid wasting SDK initialization)
+def _check_branch(task_branch: str) -> Optional[str]:
+    """Return an error message if `task_branch` does not exist in git."""
     try:
         result = subprocess.run(
             ['git', 'rev-parse', '--verify', task_branch],
@@ -128,25 +141,77 @@ def _validate_worker_params(worker_id: str, task_branch: str,
             cwd=Path.cwd()
         )
         if result.returncode != 0:
-            return False, f"Task branch {task_branch!r} does not exist in git repository"
+            return f"Task branch {task_branch!r} does not exist in git repository"
     except subprocess.TimeoutExpired:
-        return False, f"Git command timed out while checking branch {task_branch!r}"
+        return f"Git command timed out while checking branch {task_branch!r}"
     except Exception as e:
-        return False, f"Failed to verify task branch {task_branch!r}: {e}"
+        return f"Failed to verify task branch {task_branch!r}: {e}"
+    return None
+
+
+def _check_workdir(cwd: str) -> Optional[str]:
+    """Return an error message if `cwd` is not an existing git working directory."""
+    # One stat answers both "exists" and "is a directory"
+    try:
+        st = os.stat(cwd)
+    except OSError:
+        return f"Working directory does not exist: {cwd}"
+
+    if not stat.S_ISDIR(st.st_mode):
+        return f"Working directory is not a directory: {cwd}"
+
+    # .git is a directory in the main checkout and a file in worktrees
+    if not os.path.exists(os.path.join(cwd, '.git')):
+        return f"Not a git repository (no .git): {cwd}"
+
+    return None
+
 
-    # Validate working directory exists and is a git repository
-    working_dir = Path(cwd)
-    if not working_dir.exists():
-        return False, f"Working directory does not exist: {cwd}"
+async def _validate_worker_params(worker_id: str, task_branch: str,
+                                  session_info: Dict[str, Any],
+                                  cwd: str) -> tuple[bool, Optional[str]]:
+    """Validate essential worker parameters before launching.
+
+    Performs minimal validation to catch critical errors early before expensive
+    SDK initialization (fail fast). The git and filesystem checks are
+    independent, so they run concurrently in worker threads. A successful
+    result is reused for the same (task_branch, cwd) for a few seconds.
 
-    if not working_dir.is_dir():
-        return False, f"Working directory is not a directory: {cwd}"
+    Args:
+        worker_id: Worker identifier
+        task_branch: Git branch for the task
+        session_info: Session metadata
+        cwd: Working directory path
+
+    Returns:
+        Tuple of (success: bool, error_message: Optional[str])
+        - (True, None) if all validations pass
+        - (False, error_msg) if validation fails
+    """
+    now = time.monotonic()
+    # Evict expired entries so the cache only ever holds the last few seconds
+    for expired in [k for k, t in _validation_cache.items() if now - t >= _VALIDATION_TTL]:
+        del _validation_cache[expired]
+
+    key = (task_branch, cwd)
+    if key in _validation_cache:
+        return True, None
+
+    errors = await asyncio.gather(
+        asyncio.to_thread(_check_branch, task_branch),
+        asyncio.to_thread(_check_workdir, cwd),
+        return_exceptions=True
+    )
 
-    git_dir = working_dir / '.git'
-    if not git_dir.exists():
-        return False, f"Not a git repository (no .git): {cwd}"
+    # Report the first failure, branch check first
+    for error in errors:
+        if isinstance(error, BaseException):
+            return False, f"Validation failed: {error}"
+        if error is not None:
+            return False, error
 
     # All validations passed
+    _validation_cache[key] = now
     return True, None
 
 
@@ -166,79 +231,48 @@ async def run_worker(worker_id: str, task_branch: str,
     print(f"[Worker-{worker_id}] Starting on {task_branch}", flush=True)
 
     # VALIDATION: Validate parameters before expensive SDK initialization
-    validation_success, validation_error = _validate_worker_params(
+    validation_success, validation_error = await _validate_worker_params(
         worker_id, task_branch, session_info, cwd
     )
 
     if not validation_success:
         print(f"[Worker-{worker_id}] ERROR: {validation_error}", flush=True)
         return
-    # Convert to absolute path
-    if not os.path.isabs(cwd):
-        working_dir = Path(os.getcwd()) / cwd
-    else:
-        working_dir = Path(cwd)
-    working_dir = working_dir.resolve()
-
-    # Determine worker prompt file path
-    from importlib.resources import files
 
-    worker_prompt_file = str(files('flow_claude').joinpath('templates/agents/worker-template.md'))
+    # Convert to absolute path (resolve() anchors relative paths at the cwd)
+    working_dir = Path(cwd).resolve()
 
     try:
-        worker_prompt = {
-            "type": "preset",
-            "preset": "claude_code",
-            "append": "**Instructions:** See "+worker_prompt_file+" for your full workflow."
-        }
-
-        # Build worker allowed tools list
-        # Core tools always available to workers
-        # NOTE: AskUserQuestion is excluded - workers must work autonomously
-        core_worker_tools = [
-            'Bash', 'Glob', 'Grep', 'Read', 'Edit', 'Write', 'NotebookEdit',
-            'WebFetch', 'TodoWrite', 'WebSearch', 'BashOutput', 'KillShell',
-            'Skill', 'SlashCommand'
-        ]
-
-        # Add core git MCP tools (always available)
-        core_git_mcp_tools = [
-        ]
-
         # Combine core tools with additional allowed tools from orchestrator
-        worker_allowed_tools = core_worker_tools + core_git_mcp_tools
+        worker_allowed_tools = [*_CORE_WORKER_TOOLS, *_CORE_GIT_MCP_TOOLS]
         if allowed_tools:
-            worker_allowed_tools.extend(allowed_tools)
-
-        # Remove AskUserQuestion if accidentally added - workers must be autonomous
-        if 'AskUserQuestion' in worker_allowed_tools:
-            worker_allowed_tools.remove('AskUserQuestion')
+            # Drop AskUserQuestion if accidentally added - workers must be autonomous
+            worker_allowed_tools.extend(t for t in allowed_tools if t != 'AskUserQuestion')
 
         # Build MCP servers configuration for this worker
         # Uses helper function to load .mcp.json and filter based on allowed_tools
         worker_mcp_servers = build_worker_mcp_servers(working_dir, allowed_tools)
 
         # Find Claude CLI path
-        import shutil
         cli_path = shutil.which('claude')
         if not cli_path and os.name == 'nt':  # Windows fallback
             cli_path = shutil.which('claude.cmd')
 
         # Create worker-specific options
         options = ClaudeAgentOptions(
-            system_prompt=worker_prompt,
+            system_prompt=_WORKER_SYSTEM_PROMPT,
             agents={},  # Workers don't need subagents
             allowed_tools=worker_allowed_tools,
             mcp_servers=worker_mcp_servers,  # Dynamically built from .mcp.json
             cwd=str(working_dir),
             permission_mode='acceptEdits',
-            setting_sources=["user", "project", "local"],
+            setting_sources=_WORKER_SETTING_SOURCES,
             cli_path=cli_path,
             hooks={}  # Explicitly set CLI path
         )
 
         # Worker will read task instruction from the task branch's first commit
-        prompt = f"You are worker {worker_id}. 1. Read your workflow {worker_prompt_file} before implement 2. find your task from task branch {task_branch} using read_task_metadata, then complete the task."
+        prompt = f"You are worker {worker_id}. 1. Read your workflow {_WORKER_PROMPT_FILE} before implement 2. find your task from task branch {task_branch} using read_task_metadata, then complete the task."
 
 
 
@@ -267,6 +301,11 @@ async def run_worker(worker_id: str, task_branch: str,
         print(f"[Worker-{worker_id}] FAILED: {type(e).__name__}: {e}", flush=True)
 
 
+def _text_response(text: str, is_error: bool = False) -> Dict[str, Any]:
+    """Wrap text in the MCP tool response envelope."""
+    return {"content": [{"type": "text", "text": text}], "isError": is_error}
+
+
 async def launch_worker(args: Dict[str, Any]) -> Dict[str, Any]:
     """Launch worker in background using SDK query() function.
 
@@ -291,18 +330,15 @@ async def launch_worker(args: Dict[str, Any]) -> Dict[str, Any]:
             'model': args.get("model", "sonnet")
         }
 
-        validation_success, validation_error = _validate_worker_params(
+        validation_success, validation_error = await _validate_worker_params(
             worker_id, task_branch, session_info, cwd
         )
 
         if not validation_success:
-            return {
-                "content": [{
-                    "type": "text",
-                    "text": f"Worker-{worker_id} validation failed: {validation_error}"
-                }],
-                "isError": True
-            }
+            return _text_response(
+                f"Worker-{worker_id} validation failed: {validation_error}",
+                is_error=True
+            )
 
         # Run worker synchronously
         await run_worker(
@@ -314,30 +350,16 @@ async def launch_worker(args: Dict[str, Any]) -> Dict[str, Any]:
         )
 
         # Return success message after worker completes
-        return {
-            "content": [{
-                "type": "text",
-                "text": f"Worker-{worker_id} has completed task branch {task_branch}."
-            }],
-            "isError": False
-        }
+        return _text_response(f"Worker-{worker_id} has completed task branch {task_branch}.")
     except Exception as e:
-        return {
-            "content": [{
-                "type": "text",
-                "text": json.dumps({
-                    "error": f"Failed to launch worker: {str(e)}"
-                }, indent=2)
-            }],
-            "isError": True
-        }
+        return _text_response(
+            json.dumps({"error": f"Failed to launch worker: {str(e)}"}),
+            is_error=True
+        )
 
 
 def main():
     """CLI entry point."""
-    import argparse
-    import sys
-
     parser = argparse.ArgumentParser(description='Launch worker agent')
     parser.add_argument('--worker-id', type=int, required=True, help='Worker ID (e.g., 1, 2)')
     parser.add_argument('--task-branch', type=str, required=True, help='Task branch name')
@@ -356,18 +378,22 @@ def main():
         "model": args.model
     }
 
-    # Run async function
-    result = asyncio.run(launch_worker(args_dict))
+    # Run async function, on uvloop's event loop when the optional dependency is installed
+    try:
+        import uvloop
+    except ImportError:
+        result = asyncio.run(launch_worker(args_dict))
+    else:
+        result = uvloop.run(launch_worker(args_dict))
 
     # Print result
     if result.get("isError"):
-        print(json.dumps({"success": False, "error": result["content"][0]["text"]}, indent=2), file=sys.stderr)
+        print_json({"success": False, "error": result["content"][0]["text"]}, sys.stderr)
         return 1
     else:
-        print(json.dumps({"success": True, "message": result["content"][0]["text"]}, indent=2))
+        print_json({"success": True, "message": result["content"][0]["text"]}, sys.stdout)
         return 0
 
 
 if __name__ == '__main__':
-    import sys
     sys.exit(main())
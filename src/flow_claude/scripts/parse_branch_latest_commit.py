@@ -2,31 +2,145 @@
 """Read the latest commit message from any git branch."""
 import argparse
 import asyncio
-import json
 import subprocess
 import sys
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Optional
 
+from flow_claude.utils.json_output import print_json
 
-async def parse_branch_latest_commit(branch: str) -> dict:
+
+def parse_commit_message(raw: bytes) -> str:
+    """Extract the message from a raw commit object.
+
+    Args:
+        raw: Commit object as printed by `git cat-file --batch`
+
+    Returns:
+        Commit message (everything after the header block)
+    """
+    header_end = raw.find(b'\n\n')
+    if header_end == -1:
+        return ''
+    return raw[header_end + 2:].decode('utf-8', errors='replace')
+
+
+# Matches the one-shot `git log` timeout
+_BATCH_TIMEOUT = 10
+
+
+async def _read_commit(proc: asyncio.subprocess.Process, request: bytes) -> bytes:
+    """Send one request to `git cat-file --batch` and read its reply."""
+    proc.stdin.write(request)
+    await proc.stdin.drain()
+
+    # Header is "<sha> <type> <size>", or "<name> missing"/"<name> ambiguous"
+    # where <name> may itself contain spaces
+    header = (await proc.stdout.readline()).split()
+    if not header or header[-1] in (b'missing', b'ambiguous') or len(header) != 3:
+        return b''
+
+    # Object body is followed by a single newline
+    body = await proc.stdout.readexactly(int(header[2]) + 1)
+    return body[:-1] if header[1] == b'commit' else b''
+
+
+@asynccontextmanager
+async def git_batch(
+    timeout: float = _BATCH_TIMEOUT
+) -> AsyncIterator[Callable[[str], Awaitable[bytes]]]:
+    """Keep one `git cat-file --batch` process open for repeated branch reads.
+
+    Args:
+        timeout: Seconds to wait for each reply. A request that times out
+                 or is cancelled kills the process, and the next request
+                 starts a fresh one.
+
+    Yields:
+        Async callable taking a branch name and returning the raw commit
+        object it points to (empty bytes if the branch does not exist)
+
+    Example:
+        >>> async with git_batch() as send:
+        ...     for branch in branches:
+        ...         result = await parse_branch_latest_commit(branch, send)
+    """
+    proc: Optional[asyncio.subprocess.Process] = None
+    # Requests and responses share one pipe, so serialize round trips
+    lock = asyncio.Lock()
+
+    async def start() -> None:
+        nonlocal proc
+        proc = await asyncio.create_subprocess_exec(
+            'git', 'cat-file', '--batch',
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+
+    async def discard() -> None:
+        # An abandoned reply would be read by the next request, so kill
+        # this process instead of reusing it
+        nonlocal proc
+        broken, proc = proc, None
+        broken.kill()
+        await broken.wait()
+
+    async def send(branch: str) -> bytes:
+        # A newline would be read as two requests and desync the pipe
+        if '\n' in branch:
+            return b''
+
+        async with lock:
+            if proc is None:
+                await start()
+            try:
+                # Peel tags so annotated tags resolve like `git log` does
+                request = f'{branch}^{{commit}}\n'.encode('utf-8')
+                return await asyncio.wait_for(_read_commit(proc, request), timeout)
+            except asyncio.TimeoutError:
+                await discard()
+                raise subprocess.TimeoutExpired(['git', 'cat-file', '--batch'], timeout) from None
+            except BaseException:
+                await discard()
+                raise
+
+    await start()
+    try:
+        yield send
+    finally:
+        if proc is not None:
+            proc.stdin.close()
+            await proc.wait()
+
+
+async def parse_branch_latest_commit(
+    branch: str,
+    send: Optional[Callable[[str], Awaitable[bytes]]] = None
+) -> dict:
     """Read the latest commit on a git branch.
 
     Args:
         branch: Branch name (e.g., task/001-xxx, plan/xxx, or any branch)
+        send: Optional reader from git_batch(). When omitted, a one-shot
+              git process is spawned for this call.
 
     Returns:
         Dict with commit message
     """
     try:
-        # Get latest commit message
-        result = subprocess.run(
-            ['git', 'log', branch, '--format=%B', '-n', '1'],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=10
-        )
-
-        commit_message = result.stdout.strip()
+        if send is not None:
+            commit_message = parse_commit_message(await send(branch)).strip()
+        else:
+            # Get latest commit message
+            result = subprocess.run(
+                ['git', 'log', branch, '--format=%B', '-n', '1'],
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=10
+            )
+            commit_message = result.stdout.strip()
 
         if not commit_message:
             return {
@@ -85,7 +199,7 @@ Output:
     args = parser.parse_args()
 
     result = asyncio.run(parse_branch_latest_commit(args.branch))
-    print(json.dumps(result, indent=2))
+    print_json(result)
 
     return 0 if result.get('success') else 1
 
@@ -2,10 +2,11 @@
 """Read execution plan from the latest commit on a plan branch."""
 import argparse
 import asyncio
-import json
 import subprocess
 import sys
 
+from flow_claude.utils.json_output import print_json
+
 
 async def read_plan_metadata(branch: str) -> dict:
     """Read execution plan from latest commit on plan branch.
@@ -89,8 +90,7 @@ Output:
     # Run async function
     result = asyncio.run(read_plan_metadata(args.branch))
 
-    # Output JSON
-    print(json.dumps(result, indent=2))
+    print_json(result)
 
     return 0 if result.get('success') else 1
 
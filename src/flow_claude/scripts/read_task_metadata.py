@@ -2,10 +2,11 @@
 """Read task metadata from the first commit on a task branch."""
 import argparse
 import asyncio
-import json
 import subprocess
 import sys
 
+from flow_claude.utils.json_output import print_json
+
 
 async def read_task_metadata(branch: str) -> dict:
     """Read task metadata from first commit on task branch.
@@ -89,8 +90,7 @@ Output:
     # Run async function
     result = asyncio.run(read_task_metadata(args.branch))
 
-    # Output JSON
-    print(json.dumps(result, indent=2))
+    print_json(result)
 
     return 0 if result.get('success') else 1
 
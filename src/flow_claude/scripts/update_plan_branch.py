@@ -1,13 +1,42 @@
 #!/usr/bin/env python3
 """Update plan branch with complete plan snapshot."""
 import argparse
-import asyncio
+import io
 import json
 import subprocess
 import sys
 
+from flow_claude.utils.json_output import print_json
 
-async def update_plan_branch(
+
+def cleanup_message(message: str) -> str:
+    """Normalize whitespace the way `git commit` does by default.
+
+    `git commit-tree` stores its message verbatim, so this applies the same
+    cleanup `git commit -m` used to: strip trailing spaces, tabs and
+    carriage returns from each line (git keeps form feeds and vertical
+    tabs), drop leading and trailing blank lines, collapse runs of blank
+    lines into one, and end with a single newline.
+
+    Args:
+        message: Raw commit message
+
+    Returns:
+        Cleaned-up commit message
+    """
+    lines = []
+    for line in message.split('\n'):
+        line = line.rstrip(' \t\r')
+        if line or (lines and lines[-1]):
+            lines.append(line)
+
+    while lines and not lines[-1]:
+        lines.pop()
+
+    return '\n'.join(lines) + '\n' if lines else ''
+
+
+def update_plan_branch(
     plan_branch: str,
     user_request: str,
     tasks: list,
@@ -29,65 +58,77 @@ async def update_plan_branch(
         Dict with success status
     """
     try:
-        # Checkout plan branch
-        subprocess.run(
-            ['git', 'checkout', plan_branch],
-            check=True,
-            capture_output=True,
-            timeout=10
-        )
-
         # Extract session name from branch
         session_name = plan_branch.replace('plan/', '')
 
         # Build commit message (complete snapshot)
-        commit_lines = [
-            f"Update execution plan {plan_version}",
-            "",
-            "## Session Information",
-            f"Session name: {session_name}",
-            f"User Request: {user_request}",
-            f"Plan Version: {plan_version}",
-            ""
-        ]
+        buf = io.StringIO()
+        buf.write(
+            f"Update execution plan {plan_version}\n"
+            "\n"
+            "## Session Information\n"
+            f"Session name: {session_name}\n"
+            f"User Request: {user_request}\n"
+            f"Plan Version: {plan_version}\n"
+            "\n"
+        )
 
         # Add optional sections
         if kwargs.get('design_doc'):
-            commit_lines.extend([
-                "## Design Doc",
-                kwargs['design_doc'],
-                ""
-            ])
+            buf.write(f"## Design Doc\n{kwargs['design_doc']}\n\n")
 
         if kwargs.get('technology_stack'):
-            commit_lines.extend([
-                "## Technology Stack",
-                kwargs['technology_stack'],
-                ""
-            ])
+            buf.write(f"## Technology Stack\n{kwargs['technology_stack']}\n\n")
 
         # Add all tasks (complete list)
-        commit_lines.append("## Tasks")
-        for task in tasks:
+        # Blank line between task blocks; message ends with a single newline
+        buf.write("## Tasks\n")
+        for i, task in enumerate(tasks):
             depends_on = task.get('depends_on', [])
             status = task.get('status', 'pending')
 
-            commit_lines.extend([
-                f"### Task {task['id']}",
-                f"ID: {task['id']}",
-                f"Description: {task['description']}",
-                f"Status: {status}",
-                f"Depends on: {', '.join(depends_on) if depends_on else 'None'}",
-                ""
-            ])
+            if i:
+                buf.write("\n")
+            buf.write(
+                f"### Task {task['id']}\n"
+                f"ID: {task['id']}\n"
+                f"Description: {task['description']}\n"
+                f"Status: {status}\n"
+                f"Depends on: {', '.join(depends_on) if depends_on else 'None'}\n"
+            )
+
+        commit_message = cleanup_message(buf.getvalue())
+
+        # Resolve plan branch head and its tree (no checkout needed); the full
+        # ref keeps a tag of the same name from shadowing the branch
+        plan_ref = f'refs/heads/{plan_branch}'
+        result = subprocess.run(
+            ['git', 'rev-parse', f'{plan_ref}^{{commit}}', f'{plan_ref}^{{tree}}'],
+            check=True,
+            capture_output=True,
+            encoding='utf-8',
+            timeout=10
+        )
+        parent, tree = result.stdout.split()
 
-        commit_message = '\n'.join(commit_lines)
+        # Create commit object reusing the parent's tree
+        result = subprocess.run(
+            ['git', 'commit-tree', tree, '-p', parent, '-F', '-'],
+            input=commit_message,
+            check=True,
+            capture_output=True,
+            encoding='utf-8',
+            timeout=10
+        )
+        new_commit = result.stdout.strip()
 
-        # Create commit
+        # Advance the branch, failing if it moved since it was resolved
         subprocess.run(
-            ['git', 'commit', '--allow-empty', '-m', commit_message],
+            ['git', 'update-ref', plan_ref, new_commit, parent],
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            encoding='utf-8',
             timeout=10
         )
 
@@ -108,7 +149,7 @@ async def update_plan_branch(
 
     except subprocess.CalledProcessError as e:
         return {
-            "error": f"Git command failed: {e.stderr.decode() if e.stderr else str(e)}",
+            "error": f"Git command failed: {e.stderr or str(e)}",
             "success": False
         }
     except Exception as e:
@@ -195,16 +236,16 @@ Output:
         print(json.dumps({"error": f"Invalid JSON: {e}"}), file=sys.stderr)
         return 1
 
-    result = asyncio.run(update_plan_branch(
+    result = update_plan_branch(
         plan_branch=args.plan_branch,
         user_request=args.user_request,
         tasks=tasks,
         plan_version=args.version,
         design_doc=args.design_doc,
         technology_stack=args.tech_stack
-    ))
+    )
 
-    print(json.dumps(result, indent=2))
+    print_json(result)
     return 0 if result.get('success') else 1
 
 
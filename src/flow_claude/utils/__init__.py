@@ -1,9 +1,13 @@
 """Utility modules for Flow-Claude."""
 
+from .json_output import (
+    print_json
+)
 from .mcp_loader import (
     load_project_mcp_config
 )
 
 __all__ = [
-    'load_project_mcp_config'
+    'load_project_mcp_config',
+    'print_json'
 ]
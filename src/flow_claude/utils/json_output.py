@@ -0,0 +1,22 @@
+"""JSON output helper shared by Flow-Claude's command-line scripts."""
+
+import json
+import sys
+from typing import Any, Dict, Optional, TextIO
+
+
+def print_json(data: Dict[str, Any], stream: Optional[TextIO] = None) -> None:
+    """Print JSON, pretty for terminals and compact for pipes and redirects.
+
+    Args:
+        data: JSON-serializable result to print
+        stream: Output stream. Defaults to sys.stdout at call time, so
+            redirected stdout is honored.
+    """
+    if stream is None:
+        stream = sys.stdout
+
+    if stream.isatty():
+        print(json.dumps(data, indent=2), file=stream)
+    else:
+        print(json.dumps(data, separators=(',', ':')), file=stream)
@@ -0,0 +1,18 @@
+"""Shared fixtures for Flow-Claude tests."""
+
+import pytest
+
+from helpers import git
+
+
+@pytest.fixture
+def git_repo(tmp_path, monkeypatch):
+    """Temporary git repository with one commit on `main`, used as the cwd."""
+    monkeypatch.chdir(tmp_path)
+    for var in ('AUTHOR', 'COMMITTER'):
+        monkeypatch.setenv(f'GIT_{var}_NAME', 'Flow Test')
+        monkeypatch.setenv(f'GIT_{var}_EMAIL', 'flow@example.com')
+
+    git('init', '-q', '-b', 'main')
+    git('commit', '-q', '--allow-empty', '-m', 'Initial commit\n\nBody line')
+    return tmp_path
@@ -0,0 +1,13 @@
+"""Helpers shared by Flow-Claude tests."""
+
+import subprocess
+
+
+def git(*args: str) -> str:
+    """Run a git command in the current directory and return its stdout."""
+    return subprocess.run(
+        ['git', *args],
+        check=True,
+        capture_output=True,
+        encoding='utf-8'
+    ).stdout
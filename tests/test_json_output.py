@@ -0,0 +1,27 @@
+"""Tests for the shared JSON output helper."""
+
+import io
+
+from flow_claude.utils import print_json
+
+
+class _Terminal(io.StringIO):
+    def isatty(self):
+        return True
+
+
+def test_compact_when_not_a_terminal():
+    stream = io.StringIO()
+    print_json({'success': True, 'tasks': [1, 2]}, stream)
+    assert stream.getvalue() == '{"success":true,"tasks":[1,2]}\n'
+
+
+def test_pretty_for_terminals():
+    stream = _Terminal()
+    print_json({'success': True}, stream)
+    assert stream.getvalue() == '{\n  "success": true\n}\n'
+
+
+def test_defaults_to_current_stdout(capsys):
+    print_json({'success': False, 'error': 'boom'})
+    assert capsys.readouterr().out == '{"success":false,"error":"boom"}\n'
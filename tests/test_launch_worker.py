@@ -0,0 +1,97 @@
+"""Tests for launch_worker's pre-flight validation."""
+
+import asyncio
+import importlib
+import sys
+import types
+
+import pytest
+
+from helpers import git
+
+
+@pytest.fixture
+def launch_worker(monkeypatch):
+    """Import launch_worker against a stub SDK (validation never calls it)."""
+    sdk = types.ModuleType('claude_agent_sdk')
+    sdk.ClaudeAgentOptions = object
+    sdk.query = None
+    monkeypatch.setitem(sys.modules, 'claude_agent_sdk', sdk)
+    monkeypatch.delitem(sys.modules, 'flow_claude.scripts.launch_worker', raising=False)
+    return importlib.import_module('flow_claude.scripts.launch_worker')
+
+
+def test_check_branch_accepts_existing_branch(git_repo, launch_worker):
+    git('branch', 'task/001-a')
+    assert launch_worker._check_branch('task/001-a') is None
+
+
+def test_check_branch_rejects_missing_branch(git_repo, launch_worker):
+    assert launch_worker._check_branch('task/404') == (
+        "Task branch 'task/404' does not exist in git repository"
+    )
+
+
+def test_check_branch_reports_timeout(git_repo, launch_worker, monkeypatch):
+    def hang(cmd, **kwargs):
+        raise launch_worker.subprocess.TimeoutExpired(cmd, kwargs['timeout'])
+
+    monkeypatch.setattr(launch_worker.subprocess, 'run', hang)
+
+    assert launch_worker._check_branch('main') == (
+        "Git command timed out while checking branch 'main'"
+    )
+
+
+class _Clock:
+    """Stand-in for the time module with a settable monotonic clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(launch_worker, monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(launch_worker, 'time', clock)
+    monkeypatch.setattr(launch_worker, '_validation_cache', {})
+    return clock
+
+
+def _validate(launch_worker, task_branch, cwd):
+    return asyncio.run(launch_worker._validate_worker_params('1', task_branch, {}, cwd))
+
+
+def test_successful_validation_is_reused_within_ttl(git_repo, launch_worker, clock, monkeypatch):
+    cwd = str(git_repo)
+    assert _validate(launch_worker, 'main', cwd) == (True, None)
+
+    # Later checks would fail, but the cached success is still fresh
+    monkeypatch.setattr(launch_worker, '_check_branch', lambda branch: 'gone')
+    clock.now += launch_worker._VALIDATION_TTL - 0.1
+    assert _validate(launch_worker, 'main', cwd) == (True, None)
+
+    clock.now += 0.1
+    assert _validate(launch_worker, 'main', cwd) == (False, 'gone')
+
+
+def test_expired_validations_are_evicted(git_repo, launch_worker, clock):
+    git('branch', 'task/001-a')
+    cwd = str(git_repo)
+
+    _validate(launch_worker, 'main', cwd)
+    clock.now += launch_worker._VALIDATION_TTL
+    _validate(launch_worker, 'task/001-a', cwd)
+
+    assert list(launch_worker._validation_cache) == [('task/001-a', cwd)]
+
+
+def test_failed_validation_is_not_cached(git_repo, launch_worker, clock):
+    ok, error = _validate(launch_worker, 'task/404', str(git_repo))
+
+    assert ok is False
+    assert 'does not exist' in error
+    assert launch_worker._validation_cache == {}
@@ -0,0 +1,114 @@
+"""Tests for the batched branch reader in parse_branch_latest_commit."""
+
+import asyncio
+
+import pytest
+
+from flow_claude.scripts.parse_branch_latest_commit import (
+    git_batch,
+    parse_branch_latest_commit,
+    parse_commit_message,
+)
+
+from helpers import git
+
+
+def _read_all(branches):
+    """Read each branch in order through a single git_batch() process."""
+    async def run():
+        async with git_batch() as send:
+            return [await parse_branch_latest_commit(b, send) for b in branches]
+    return asyncio.run(run())
+
+
+def test_parse_commit_message_returns_text_after_headers():
+    raw = b'tree abc\nparent def\n\nSubject\n\nBody\n'
+    assert parse_commit_message(raw) == 'Subject\n\nBody\n'
+    assert parse_commit_message(b'tree abc\n') == ''
+
+
+def test_hit_returns_latest_commit_message(git_repo):
+    [result] = _read_all(['main'])
+    assert result == {
+        'success': True,
+        'branch': 'main',
+        'message': 'Initial commit\n\nBody line'
+    }
+
+
+def test_missing_branch_reports_no_commits(git_repo):
+    [result] = _read_all(['task/does-not-exist'])
+    assert result['success'] is False
+    assert result['error'] == 'No commits found on branch task/does-not-exist'
+
+
+def test_name_with_whitespace_is_a_miss(git_repo):
+    [result] = _read_all(['a b'])
+    assert result['success'] is False
+    assert 'No commits found' in result['error']
+
+
+def test_name_with_newline_is_rejected_without_desync(git_repo):
+    git('branch', 'other')
+    git('commit', '-q', '--allow-empty', '-m', 'Second on main')
+
+    results = _read_all(['x\nmain', 'other', 'main'])
+
+    assert results[0]['success'] is False
+    assert results[1]['message'] == 'Initial commit\n\nBody line'
+    assert results[2]['message'] == 'Second on main'
+
+
+def test_sequential_lookups_share_one_process(git_repo):
+    git('checkout', '-q', '-b', 'task/001-a')
+    git('commit', '-q', '--allow-empty', '-m', 'Task one')
+    git('checkout', '-q', '-b', 'task/002-b')
+    git('commit', '-q', '--allow-empty', '-m', 'Task two')
+
+    results = _read_all(['task/001-a', 'missing', 'task/002-b', 'main', 'task/001-a'])
+
+    assert [r.get('message') for r in results] == [
+        'Task one',
+        None,
+        'Task two',
+        'Initial commit\n\nBody line',
+        'Task one',
+    ]
+
+
+def test_annotated_tag_resolves_to_its_commit(git_repo):
+    git('tag', '-a', 'v1', '-m', 'Tag msg')
+
+    [result] = _read_all(['v1'])
+
+    assert result['message'] == 'Initial commit\n\nBody line'
+
+
+def test_cancelled_request_does_not_desync_later_reads(git_repo):
+    git('branch', 'other')
+    git('commit', '-q', '--allow-empty', '-m', 'Second')
+
+    async def run():
+        async with git_batch() as send:
+            # Cancel once the request is written but before its reply is read
+            pending = asyncio.ensure_future(send('other'))
+            await asyncio.sleep(0)
+            pending.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await pending
+            return [await parse_branch_latest_commit(b, send) for b in ('main', 'other')]
+
+    results = asyncio.run(run())
+
+    assert [r['message'] for r in results] == ['Second', 'Initial commit\n\nBody line']
+
+
+def test_timed_out_request_reports_an_error(git_repo):
+    async def run():
+        async with git_batch(timeout=0) as send:
+            return await parse_branch_latest_commit('main', send)
+
+    result = asyncio.run(run())
+
+    assert result['success'] is False
+    assert 'timed out' in result['error']
@@ -0,0 +1,138 @@
+"""Tests for update_plan_branch's plumbing-based plan commits."""
+
+import subprocess
+
+import pytest
+
+from flow_claude.scripts.update_plan_branch import cleanup_message, update_plan_branch
+
+from helpers import git
+
+
+@pytest.fixture
+def plan_repo(git_repo):
+    """Repository with a plan branch and `main` still checked out."""
+    git('branch', 'plan/session')
+    return git_repo
+
+
+@pytest.mark.parametrize('message', [
+    'Subject\n\nBody',
+    'Subject  \n\n\n\nBody\t\n\n',
+    '\n\nSubject\n \nBody\r\n\n',
+    'Doc: dd\n\n\n\n## Tasks\n',
+    'a\f\nb',
+    'a\v',
+    'a \t\r\v\f \nb\n',
+])
+def test_cleanup_message_matches_git_stripspace(message):
+    # Compare bytes: text mode would turn a kept "\r" into "\n"
+    expected = subprocess.run(
+        ['git', 'stripspace'],
+        input=message.encode('utf-8'),
+        check=True,
+        capture_output=True
+    ).stdout.decode('utf-8')
+    assert cleanup_message(message) == expected
+
+
+def test_commit_message_is_cleaned_up(plan_repo):
+    result = update_plan_branch(
+        plan_branch='plan/session',
+        user_request='Add login  ',
+        tasks=[
+            {'id': '001', 'description': 'Create model ', 'depends_on': [], 'status': 'completed'},
+            {'id': '002', 'description': 'Add endpoint', 'depends_on': ['001'], 'status': 'pending'},
+        ],
+        plan_version='v2',
+        design_doc='dd\n\n',
+        technology_stack='Python  '
+    )
+
+    assert result['success'] is True
+    assert result['completed'] == 1
+    assert result['pending'] == 1
+    assert git('log', '-1', '--format=%B', 'plan/session') == (
+        'Update execution plan v2\n'
+        '\n'
+        '## Session Information\n'
+        'Session name: session\n'
+        'User Request: Add login\n'
+        'Plan Version: v2\n'
+        '\n'
+        '## Design Doc\n'
+        'dd\n'
+        '\n'
+        '## Technology Stack\n'
+        'Python\n'
+        '\n'
+        '## Tasks\n'
+        '### Task 001\n'
+        'ID: 001\n'
+        'Description: Create model\n'
+        'Status: completed\n'
+        'Depends on: None\n'
+        '\n'
+        '### Task 002\n'
+        'ID: 002\n'
+        'Description: Add endpoint\n'
+        'Status: pending\n'
+        'Depends on: 001\n'
+        '\n'
+    )
+
+
+def test_head_and_index_are_left_unchanged(plan_repo):
+    (plan_repo / 'staged.txt').write_text('staged\n')
+    git('add', 'staged.txt')
+    (plan_repo / 'untracked.txt').write_text('untracked\n')
+
+    main_before = git('rev-parse', 'main')
+    plan_before = git('rev-parse', 'plan/session').strip()
+    status_before = git('status', '--porcelain')
+
+    result = update_plan_branch(
+        plan_branch='plan/session',
+        user_request='Add login',
+        tasks=[],
+        plan_version='v2'
+    )
+
+    assert result['success'] is True
+    assert git('symbolic-ref', 'HEAD') == 'refs/heads/main\n'
+    assert git('rev-parse', 'main') == main_before
+    assert git('status', '--porcelain') == status_before
+
+    # The new plan commit sits on the old head and keeps its tree
+    assert git('rev-parse', 'plan/session^').strip() == plan_before
+    assert git('rev-parse', 'plan/session^{tree}') == git('rev-parse', f'{plan_before}^{{tree}}')
+
+
+def test_missing_plan_branch_fails_without_side_effects(plan_repo):
+    result = update_plan_branch(
+        plan_branch='plan/missing',
+        user_request='Add login',
+        tasks=[],
+        plan_version='v2'
+    )
+
+    assert result['success'] is False
+    assert result['error'].startswith('Git command failed:')
+    assert git('branch', '--list', 'plan/missing') == ''
+
+
+def test_branch_wins_over_tag_with_same_name(plan_repo):
+    git('tag', 'plan/session', 'main')
+    git('commit', '-q', '--allow-empty', '-m', 'Moves main past the tag')
+    git('update-ref', 'refs/heads/plan/session', 'main')
+    branch_before = git('rev-parse', 'refs/heads/plan/session').strip()
+
+    result = update_plan_branch(
+        plan_branch='plan/session',
+        user_request='Add login',
+        tasks=[],
+        plan_version='v2'
+    )
+
+    assert result['success'] is True
+    assert git('rev-parse', 'refs/heads/plan/session^').strip() == branch_before